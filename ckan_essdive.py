@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import abc
+import asyncio
+import contextlib
+import gzip
+import json
 import logging
+import os
 import pathlib
-from typing import Any, Dict, List, Optional
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Awaitable, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     from tapipy.tapis import Tapis  # type: ignore
@@ -14,9 +27,35 @@ except Exception:  # pragma: no cover - optional dependency
     Tapis = None
     logging.warning("tapipy not available; Tapis-powered uploads will be skipped.")
 
+try:
+    import httpx  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import json_stream  # type: ignore
+    import json_stream.requests  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    json_stream = None
+
 
 USER_AGENT = "ckan-to-ess-dive-notebook"
 
+# Retry policy for idempotent requests, shared by the sync and async clients.
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# Read-only CKAN actions whose results are memoized across clients.
+CACHEABLE_ACTIONS = frozenset({"package_show", "package_search"})
+# Upper bound on raw CKAN response bytes memoized per process.
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 REQUIRED_FIELDS = {
     "title": "Title",
     "description": "Description / abstract",
@@ -24,10 +63,74 @@ REQUIRED_FIELDS = {
     "contacts": "Primary contact / maintainer",
     "keywords": "Keywords / tags",
 }
+# Frozen once so validation walks a tuple rather than the dict on every call.
+_REQUIRED_FIELDS_ITEMS = tuple(REQUIRED_FIELDS.items())
 
 
-class CkanEssDiveClient:
-    """Lightweight helper for CKAN ➜ ESS-DIVE flows."""
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        # CKAN extras may carry a null key; stdlib json tolerates that too.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+# Raw CKAN response bodies keyed by (ckan_url, ckan_key, action, params). Module-level so
+# the notebook's short-lived clients (one per widget action) still share hits.
+_ckan_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+_ckan_cache_bytes = 0
+_ckan_cache_lock = threading.Lock()
+
+
+def clear_ckan_cache() -> None:
+    """Forget all memoized CKAN metadata (e.g. after editing a dataset in CKAN)."""
+    global _ckan_cache_bytes
+    with _ckan_cache_lock:
+        _ckan_cache.clear()
+        _ckan_cache_bytes = 0
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+    with _ckan_cache_lock:
+        body = _ckan_cache.get(key)
+        if body is None:
+            return None
+        _ckan_cache.move_to_end(key)
+    # Decode on every hit so callers never share (and mutate) cached objects.
+    return _json_loads(body)["result"]
+
+
+def _cache_put(key: Tuple[Any, ...], body: bytes) -> None:
+    global _ckan_cache_bytes
+    if len(body) > CACHE_MAX_BYTES:
+        return
+    with _ckan_cache_lock:
+        previous = _ckan_cache.pop(key, None)
+        if previous is not None:
+            _ckan_cache_bytes -= len(previous)
+        _ckan_cache[key] = body
+        _ckan_cache_bytes += len(body)
+        while _ckan_cache_bytes > CACHE_MAX_BYTES:
+            _, evicted = _ckan_cache.popitem(last=False)
+            _ckan_cache_bytes -= len(evicted)
+
+
+class _CkanEssDiveBase(abc.ABC):
+    """Transport-independent pieces shared by the sync and async clients."""
+
+    # Bytes read per iteration when streaming resources to disk.
+    DOWNLOAD_CHUNK_SIZE = 1 << 20
+    # Sidecar in the staging directory recording each staged file's source URL and ETag.
+    STAGE_CACHE_NAME = ".cache.json"
+    # Bytes fed to the incremental JSON parser for ``stream_large`` requests.
+    JSON_STREAM_CHUNK_SIZE = 65536
+    # Submission bodies below this size are not worth gzipping.
+    COMPRESS_MIN_BYTES = 64 * 1024
 
     def __init__(
         self,
@@ -38,84 +141,115 @@ class CkanEssDiveClient:
         ess_token: str = "",
         local_stage: str | pathlib.Path = "./staging",
         dry_run: bool = True,
+        max_workers: int = 8,
+        compress_uploads: bool = False,
     ) -> None:
         self.ckan_url = ckan_url.rstrip("/")
         self.ckan_key = ckan_key
         self.ess_url = ess_url.rstrip("/")
         self.ess_token = ess_token
-        self.local_stage = pathlib.Path(local_stage).expanduser()
+        self.local_stage = local_stage
         self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.compress_uploads = compress_uploads
+        self._setup_transport()
+
+    @abc.abstractmethod
+    def _setup_transport(self) -> None:
+        """Create the HTTP session or client used by the subclass."""
+
+    @property
+    def local_stage(self) -> pathlib.Path:
+        return self._local_stage
+
+    @local_stage.setter
+    def local_stage(self, value: str | pathlib.Path) -> None:
+        self._local_stage = pathlib.Path(value).expanduser()
+        self._stage_root = self._local_stage.resolve()
+        # Staging bookkeeping describes files in the previous directory.
+        self._url_to_path: Dict[str, pathlib.Path] = {}
+        self._path_owner: Dict[pathlib.Path, str] = {}
+        self._etags: Optional[Dict[str, Dict[str, str]]] = None
 
     # ---- CKAN helpers ----
     @staticmethod
     def _headers(api_key: str = "") -> Dict[str, str]:
-        headers = {"User-Agent": USER_AGENT}
+        # Accept-Encoding is left to each HTTP library, which only offers codings it can decode.
+        headers = {"User-Agent": USER_AGENT, "Accept": "application/json"}
         if api_key:
             headers["Authorization"] = api_key
         return headers
 
-    def ckan_request(
-        self, action: str, params: Dict[str, Any] | None = None
-    ) -> Dict[str, Any]:
-        url = f"{self.ckan_url}/api/3/action/{action}"
-        resp = requests.get(
-            url, headers=self._headers(self.ckan_key), params=params or {}, timeout=60
-        )
-        resp.raise_for_status()
-        payload = resp.json()
+    @classmethod
+    def _download_headers(cls, api_key: str = "") -> Dict[str, str]:
+        # Resource files are often already compressed; fetch the bytes as stored.
+        headers = cls._headers(api_key)
+        headers["Accept"] = "*/*"
+        headers["Accept-Encoding"] = "identity"
+        return headers
+
+    def _cache_key(self, action: str, params: Dict[str, Any] | None) -> Optional[Tuple[Any, ...]]:
+        if action not in CACHEABLE_ACTIONS:
+            return None
+        # The key is part of the cache key: private datasets differ per credential.
+        params_key = tuple(sorted((key, str(value)) for key, value in (params or {}).items()))
+        return (self.ckan_url, self.ckan_key, action, params_key)
+
+    def clear_cache(self) -> None:
+        """Forget memoized CKAN metadata (e.g. after editing a dataset in CKAN)."""
+        clear_ckan_cache()
+
+    @staticmethod
+    def _ckan_result(action: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         if not payload.get("success"):
             raise RuntimeError(f"CKAN call {action} failed: {payload}")
         return payload["result"]
 
-    def list_ckan_packages(
-        self, search: str | None = None, limit: int = 40
-    ) -> List[Dict[str, Any]]:
-        params: Dict[str, Any] = {"rows": limit}
-        if search:
-            params["q"] = search
-        result = self.ckan_request("package_search", params=params)
-        return result.get("results", [])
-
-    def get_ckan_package(self, name_or_id: str) -> Dict[str, Any]:
-        return self.ckan_request("package_show", params={"id": name_or_id})
+    @staticmethod
+    def _remaining_offsets(first_page: Dict[str, Any]) -> range:
+        # CKAN caps rows at ckan.search.rows_max, so step by what the server actually returned.
+        step = len(first_page.get("results") or ())
+        if not step:
+            return range(0)
+        return range(step, first_page.get("count", 0), step)
 
     # ---- Mapping helpers ----
     @staticmethod
     def map_ckan_to_essdive(package: Dict[str, Any]) -> Dict[str, Any]:
-        extras = {item.get("key"): item.get("value") for item in package.get("extras", [])}
-        creators = []
-        if package.get("author") or package.get("author_email"):
-            creators.append({"name": package.get("author"), "email": package.get("author_email")})
-        contacts = []
-        if package.get("maintainer") or package.get("maintainer_email"):
-            contacts.append(
-                {"name": package.get("maintainer"), "email": package.get("maintainer_email")}
-            )
+        pkg_get = package.get
+        extras = {item.get("key"): item.get("value") for item in pkg_get("extras") or ()}
+        extras_get = extras.get
+        author, author_email = pkg_get("author"), pkg_get("author_email")
+        maintainer, maintainer_email = pkg_get("maintainer"), pkg_get("maintainer_email")
+        creators = [{"name": author, "email": author_email}] if author or author_email else []
+        contacts = (
+            [{"name": maintainer, "email": maintainer_email}] if maintainer or maintainer_email else []
+        )
 
         payload: Dict[str, Any] = {
-            "title": package.get("title") or package.get("name"),
-            "description": package.get("notes"),
-            "keywords": [tag.get("display_name") for tag in package.get("tags", []) if tag.get("display_name")],
+            "title": pkg_get("title") or pkg_get("name"),
+            "description": pkg_get("notes"),
+            "keywords": [tag["display_name"] for tag in pkg_get("tags") or () if tag.get("display_name")],
             "creators": creators,
             "contacts": contacts,
             "temporalCoverage": {
-                "startDate": extras.get("temporal_start") or extras.get("time_start"),
-                "endDate": extras.get("temporal_end") or extras.get("time_end"),
+                "startDate": extras_get("temporal_start") or extras_get("time_start"),
+                "endDate": extras_get("temporal_end") or extras_get("time_end"),
             },
-            "spatialCoverage": extras.get("spatial") or extras.get("bbox"),
-            "communities": [group.get("name") for group in package.get("groups", []) if group.get("name")],
-            "sourceCkanId": package.get("id"),
-            "sourceCkanName": package.get("name"),
+            "spatialCoverage": extras_get("spatial") or extras_get("bbox"),
+            "communities": [group["name"] for group in pkg_get("groups") or () if group.get("name")],
+            "sourceCkanId": pkg_get("id"),
+            "sourceCkanName": pkg_get("name"),
             "resources": [
                 {
-                    "id": res.get("id"),
-                    "name": res.get("name"),
-                    "url": res.get("url"),
-                    "format": res.get("format"),
-                    "description": res.get("description"),
-                    "size": res.get("size"),
+                    "id": res_get("id"),
+                    "name": res_get("name"),
+                    "url": res_get("url"),
+                    "format": res_get("format"),
+                    "description": res_get("description"),
+                    "size": res_get("size"),
                 }
-                for res in package.get("resources", [])
+                for res_get in (res.get for res in pkg_get("resources") or ())
             ],
             "extras": extras,
         }
@@ -123,14 +257,13 @@ class CkanEssDiveClient:
 
     @staticmethod
     def find_missing_metadata(payload: Dict[str, Any]) -> List[str]:
-        missing: List[str] = []
-        for key, label in REQUIRED_FIELDS.items():
-            value = payload.get(key)
-            if not value:
-                missing.append(label)
-            elif isinstance(value, list) and not any(value):
-                missing.append(label)
-        temporal = payload.get("temporalCoverage") or {}
+        payload_get = payload.get
+        missing = [
+            label
+            for key, label in _REQUIRED_FIELDS_ITEMS
+            if not (value := payload_get(key)) or (isinstance(value, list) and not any(value))
+        ]
+        temporal = payload_get("temporalCoverage") or {}
         if not temporal.get("startDate"):
             missing.append("Temporal start date")
         if not temporal.get("endDate"):
@@ -139,66 +272,173 @@ class CkanEssDiveClient:
 
     @staticmethod
     def summarize_payload(payload: Dict[str, Any]) -> str:
-        lines = [
-            f"Title: {payload.get('title')}",
-            f"Keywords: {', '.join(payload.get('keywords', [])) or 'none'}",
-            f"Creators: {', '.join([c.get('name') or '' for c in payload.get('creators', [])]) or 'none'}",
-            f"Contacts: {', '.join([c.get('email') or c.get('name') or '' for c in payload.get('contacts', [])]) or 'none'}",
-            f"Temporal: {payload.get('temporalCoverage', {})}",
-            f"Resources: {len(payload.get('resources', []))}",
-        ]
-        return "\n".join(lines)
+        payload_get = payload.get
+        keywords = ", ".join(payload_get("keywords") or ()) or "none"
+        creators = ", ".join(c.get("name") or "" for c in payload_get("creators") or ()) or "none"
+        contacts = (
+            ", ".join(c.get("email") or c.get("name") or "" for c in payload_get("contacts") or ())
+            or "none"
+        )
+        return (
+            f"Title: {payload_get('title')}\n"
+            f"Keywords: {keywords}\n"
+            f"Creators: {creators}\n"
+            f"Contacts: {contacts}\n"
+            f"Temporal: {payload_get('temporalCoverage', {})}\n"
+            f"Resources: {len(payload_get('resources') or ())}"
+        )
 
     # ---- Resource handling ----
     @staticmethod
     def _resource_filename(resource: Dict[str, Any]) -> str:
         name = resource.get("name") or resource.get("id") or "resource"
         url = resource.get("url") or ""
-        suffix = pathlib.Path(url).suffix if url else ""
+        if "?" in url or "#" in url or url.endswith(("/", ".")):
+            suffix = pathlib.PurePath(url).suffix
+        else:
+            # Plain URLs: slice the suffix off the last path segment without pathlib.
+            slash = url.rfind("/")
+            dot = url.rfind(".")
+            suffix = url[dot:] if dot > slash + 1 else ""
         if suffix.lower() in {".html", ".htm"}:
             return ""
         if suffix and not name.endswith(suffix):
             return f"{name}{suffix}"
         return name if suffix else ""
 
-    def download_resource(self, resource: Dict[str, Any]) -> pathlib.Path:
+    def _resource_target(self, resource: Dict[str, Any]) -> Tuple[str, pathlib.Path]:
         url = resource.get("url")
         if not url:
             raise ValueError("Resource has no URL to download")
         filename = self._resource_filename(resource)
         if not filename:
             raise ValueError("Resource URL has no file extension; skipping download")
-        path = self.local_stage.expanduser().resolve() / filename
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with requests.get(url, headers=self._headers(self.ckan_key), stream=True, timeout=300) as resp:
-            resp.raise_for_status()
-            with open(path, "wb") as handle:
-                for chunk in resp.iter_content(chunk_size=512 * 1024):
-                    if chunk:
-                        handle.write(chunk)
-        return path
+        return url, self._stage_root / filename
 
-    def stage_resources(self, package: Dict[str, Any]) -> List[pathlib.Path]:
-        saved: List[pathlib.Path] = []
-        for res in package.get("resources", []):
+    def _stage_cache(self) -> Dict[str, Dict[str, str]]:
+        """Staged filename ➜ {url, etag} entries persisted next to the staged files."""
+        if self._etags is None:
+            try:
+                loaded = _json_loads((self._stage_root / self.STAGE_CACHE_NAME).read_bytes())
+            except (OSError, ValueError):
+                loaded = {}
+            self._etags = {
+                name: entry
+                for name, entry in loaded.items()
+                if isinstance(entry, dict) and entry.get("url") and entry.get("etag")
+            }
+        return self._etags
+
+    def _save_stage_cache(self) -> None:
+        if self._etags is None or not self._stage_root.is_dir():
+            return
+        target = self._stage_root / self.STAGE_CACHE_NAME
+        tmp = target.with_name(f"{target.name}.tmp")
+        tmp.write_bytes(_json_dumps(self._etags))
+        os.replace(tmp, target)
+
+    def _owns(self, url: str, path: pathlib.Path) -> bool:
+        """True if ``path`` still holds the bytes last staged from ``url``."""
+        return self._path_owner.get(path) == url and path.exists()
+
+    def _conditional_headers(self, url: str, path: pathlib.Path) -> Dict[str, str]:
+        headers = self._download_headers(self.ckan_key)
+        entry = self._stage_cache().get(path.name)
+        if entry and entry["url"] == url and path.exists():
+            headers["If-None-Match"] = entry["etag"]
+        return headers
+
+    def _record_download(self, url: str, path: pathlib.Path, etag: Optional[str]) -> None:
+        self._url_to_path[url] = path
+        self._path_owner[path] = url
+        if etag:
+            self._stage_cache()[path.name] = {"url": url, "etag": etag}
+        else:
+            # Whatever was recorded for this file described other bytes.
+            self._stage_cache().pop(path.name, None)
+
+    def _plan_staging(
+        self, resources: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, pathlib.Path], Dict[str, Tuple[Dict[str, Any], pathlib.Path]]]:
+        """Split resources into already-staged paths and one download per distinct URL.
+
+        Mirrors and re-ingested datasets often repeat a URL, and unrelated
+        resources can share a name; each URL is fetched once and colliding
+        filenames get a ``-2``, ``-3``... suffix so no two downloads share a file.
+        """
+        self._stage_cache()  # load before worker threads share it
+        staged: Dict[str, pathlib.Path] = {}
+        for res in resources:
+            url = res.get("url")
+            known = self._url_to_path.get(url) if url else None
+            if known is not None and self._owns(url, known):
+                staged[url] = known
+        taken = set(staged.values())
+        pending: Dict[str, Tuple[Dict[str, Any], pathlib.Path]] = {}
+        for res in resources:
+            if res.get("url") in staged or res.get("url") in pending:
+                continue
             try:
-                saved.append(self.download_resource(res))
-            except Exception as exc:  # pragma: no cover - depends on remote endpoints
+                url, path = self._resource_target(res)
+            except ValueError as exc:
                 logging.warning("Could not stage %s: %s", res.get("name"), exc)
-        return saved
+                continue
+            path = self._unique_path(path, taken)
+            taken.add(path)
+            pending[url] = (res, path)
+        return staged, pending
+
+    @staticmethod
+    def _unique_path(path: pathlib.Path, taken: set) -> pathlib.Path:
+        candidate, n = path, 2
+        while candidate in taken:
+            candidate = path.with_name(f"{path.stem}-{n}{path.suffix}")
+            n += 1
+        return candidate
+
+    @staticmethod
+    def _ordered_staged(
+        resources: List[Dict[str, Any]], staged: Dict[str, pathlib.Path]
+    ) -> List[pathlib.Path]:
+        # Keep the package's resource order; duplicate URLs share one file.
+        urls = (res.get("url") for res in resources)
+        return list(dict.fromkeys(staged[url] for url in urls if url in staged))
+
+    @contextlib.contextmanager
+    def _staged_file(self, path: pathlib.Path) -> Iterator[BinaryIO]:
+        """Write beside ``path`` and move the file into place only once writing succeeds."""
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.part")
+        try:
+            handle = open(tmp, "xb")
+        except FileNotFoundError:
+            # Created on first download (browsing-only clients leave no directory
+            # behind), and again if it was removed between staging runs.
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(tmp, "xb")
+        try:
+            with handle:
+                yield handle
+            os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
 
     # ---- ESS-DIVE submission ----
-    def submit_to_essdive(self, payload: Dict[str, Any]) -> Dict[str, Any]:
-        if self.dry_run:
-            return {"status": "skipped", "reason": "dry_run_enabled"}
+    def _essdive_headers(self) -> Dict[str, str]:
         token = self.ess_token.strip()
         if not token:
             raise RuntimeError("ESS-DIVE token is required to write")
-        headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-        url = f"{self.ess_url}/datasets"
-        resp = requests.post(url, headers=headers, json=payload, timeout=90)
-        resp.raise_for_status()
-        return resp.json()
+        return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+    def _essdive_body(self, payload: Dict[str, Any]) -> Tuple[Dict[str, str], bytes]:
+        """Serialize ``payload`` once to bytes, optionally gzipped, with matching headers."""
+        headers = self._essdive_headers()
+        body = _json_dumps(payload)
+        if self.compress_uploads and len(body) > self.COMPRESS_MIN_BYTES:
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+        headers["Content-Length"] = str(len(body))
+        return headers, body
 
     # ---- Auth helpers ----
     @staticmethod
@@ -220,10 +460,336 @@ class CkanEssDiveClient:
         base_url: str = "https://portals.tapis.io",
     ) -> str:
         token = self.get_ckan_token_via_tapis(username, password, base_url)
+        # Cache entries are keyed by credential, so earlier results are not reused.
         self.ckan_key = token
         return token
 
 
+class CkanEssDiveClient(_CkanEssDiveBase):
+    """Lightweight helper for CKAN ➜ ESS-DIVE flows."""
+
+    # ---- Session lifecycle ----
+    def _setup_transport(self) -> None:
+        self._session = self._build_session()
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Pooled session shared by all calls; retries only idempotent requests."""
+        session = requests.Session()
+        retries = Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF, status_forcelist=RETRY_STATUSES)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "CkanEssDiveClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    # ---- CKAN helpers ----
+    def ckan_request(
+        self,
+        action: str,
+        params: Dict[str, Any] | None = None,
+        *,
+        refresh: bool = False,
+        cache: bool = True,
+        stream_large: bool = False,
+    ) -> Dict[str, Any]:
+        """Call a CKAN action and return its ``result``.
+
+        Read-only actions are memoized unless ``cache`` is false; ``refresh``
+        skips the lookup but stores the fresh response. ``stream_large`` parses
+        the body while it downloads (via ``json_stream``) instead of buffering
+        it first, and is never cached; use it for very large ``package_search``
+        pages. It falls back to the buffered path if ``json_stream`` is missing.
+        """
+        key = self._cache_key(action, params) if cache and not stream_large else None
+        if key is not None and not refresh:
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+        url = f"{self.ckan_url}/api/3/action/{action}"
+        stream = stream_large and json_stream is not None
+        with self._session.get(
+            url, headers=self._headers(self.ckan_key), params=params or {}, timeout=60, stream=stream
+        ) as resp:
+            resp.raise_for_status()
+            if stream:
+                payload = json_stream.to_standard_types(
+                    json_stream.requests.load(resp, chunk_size=self.JSON_STREAM_CHUNK_SIZE)
+                )
+            else:
+                body = resp.content
+                payload = _json_loads(body)
+        result = self._ckan_result(action, payload)
+        if key is not None:
+            _cache_put(key, body)
+        return result
+
+    def list_ckan_packages(
+        self, search: str | None = None, limit: int = 40
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"rows": limit}
+        if search:
+            params["q"] = search
+        result = self.ckan_request("package_search", params=params)
+        return result.get("results", [])
+
+    def list_ckan_packages_all(
+        self, search: str | None = None, page_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        """Fetch every matching package, requesting pages after the first concurrently."""
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        params: Dict[str, Any] = {"rows": page_size, "start": 0}
+        if search:
+            params["q"] = search
+        first = self.ckan_request("package_search", params=params, cache=False)
+        packages = list(first.get("results", []))
+        offsets = self._remaining_offsets(first)
+        if not offsets:
+            return packages
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(offsets)))) as pool:
+            pages = pool.map(
+                lambda offset: self.ckan_request(
+                    "package_search", params={**params, "start": offset}, cache=False
+                ),
+                offsets,
+            )
+            for page in pages:
+                packages.extend(page.get("results", []))
+        return packages
+
+    def get_ckan_package(self, name_or_id: str, *, refresh: bool = False) -> Dict[str, Any]:
+        return self.ckan_request("package_show", params={"id": name_or_id}, refresh=refresh)
+
+    # ---- Resource handling ----
+    def download_resource(self, resource: Dict[str, Any]) -> pathlib.Path:
+        return self._download(*self._resource_target(resource))
+
+    def _download(self, url: str, path: pathlib.Path) -> pathlib.Path:
+        headers = self._conditional_headers(url, path)
+        with self._session.get(url, headers=headers, stream=True, timeout=300) as resp:
+            if resp.status_code == 304:
+                self._record_download(url, path, headers["If-None-Match"])
+                return path
+            resp.raise_for_status()
+            # Copy straight from the urllib3 stream; copyfileobj loops in C.
+            resp.raw.decode_content = True
+            with self._staged_file(path) as handle:
+                shutil.copyfileobj(resp.raw, handle, length=self.DOWNLOAD_CHUNK_SIZE)
+            self._record_download(url, path, resp.headers.get("ETag"))
+        return path
+
+    def stage_resources(self, package: Dict[str, Any]) -> List[pathlib.Path]:
+        resources = package.get("resources", [])
+        if not resources:
+            return []
+        staged, pending = self._plan_staging(resources)
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(pending)))) as pool:
+                futures = {
+                    pool.submit(self._download, url, path): url for url, (_, path) in pending.items()
+                }
+                for future in as_completed(futures):
+                    url = futures[future]
+                    try:
+                        staged[url] = future.result()
+                    except Exception as exc:  # pragma: no cover - depends on remote endpoints
+                        logging.warning("Could not stage %s: %s", pending[url][0].get("name"), exc)
+            self._save_stage_cache()
+        return self._ordered_staged(resources, staged)
+
+    # ---- ESS-DIVE submission ----
+    def submit_to_essdive(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.dry_run:
+            return {"status": "skipped", "reason": "dry_run_enabled"}
+        headers, body = self._essdive_body(payload)
+        url = f"{self.ess_url}/datasets"
+        resp = self._session.post(url, headers=headers, data=body, timeout=90)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+
+class AsyncCkanEssDiveClient(_CkanEssDiveBase):
+    """asyncio counterpart of :class:`CkanEssDiveClient` backed by ``httpx.AsyncClient``.
+
+    Network helpers are coroutines; mapping and validation helpers are shared.
+    Use ``async with`` (or ``await client.aclose()``) to release sockets.
+    """
+
+    def __init__(self, *, max_connections: int = 64, **kwargs: Any) -> None:
+        if httpx is None:
+            raise RuntimeError("httpx is not installed; cannot use the async client")
+        self._max_connections = max_connections
+        super().__init__(**kwargs)
+
+    def _setup_transport(self) -> None:
+        # Default transport, so HTTP(S)_PROXY is honoured like in requests; _get retries.
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=self._max_connections),
+            follow_redirects=True,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncCkanEssDiveClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def _gather_bounded(
+        self, coros: Iterable[Awaitable[Any]], *, return_exceptions: bool = False
+    ) -> List[Any]:
+        """gather() with at most ``max_workers`` awaitables in flight, like the sync thread pools."""
+        limit = asyncio.Semaphore(self.max_workers)
+
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with limit:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=return_exceptions)
+
+    async def _get(self, url: str, *, stream: bool = False, **kwargs: Any) -> "httpx.Response":
+        """GET with the connect and 429/5xx retry policy the sync client's adapter applies."""
+        request = self._client.build_request("GET", url, **kwargs)
+        attempt = 0
+        while True:
+            try:
+                resp = await self._client.send(request, stream=stream)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt >= RETRY_TOTAL:
+                    raise
+                delay = RETRY_BACKOFF * (2**attempt)
+            else:
+                if resp.status_code not in RETRY_STATUSES or attempt >= RETRY_TOTAL:
+                    return resp
+                retry_after = resp.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF * (2**attempt)
+                await resp.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    # ---- CKAN helpers ----
+    async def ckan_request(
+        self,
+        action: str,
+        params: Dict[str, Any] | None = None,
+        *,
+        refresh: bool = False,
+        cache: bool = True,
+        stream_large: bool = False,
+    ) -> Dict[str, Any]:
+        """Call a CKAN action and return its ``result``.
+
+        Caching follows :meth:`CkanEssDiveClient.ckan_request`. ``stream_large``
+        is accepted for parity and still bypasses the cache, but ``json_stream``
+        has no asyncio reader, so the body is always buffered.
+        """
+        key = self._cache_key(action, params) if cache and not stream_large else None
+        if key is not None and not refresh:
+            cached = _cache_get(key)
+            if cached is not None:
+                return cached
+        url = f"{self.ckan_url}/api/3/action/{action}"
+        resp = await self._get(url, headers=self._headers(self.ckan_key), params=params or {}, timeout=60)
+        resp.raise_for_status()
+        result = self._ckan_result(action, _json_loads(resp.content))
+        if key is not None:
+            _cache_put(key, resp.content)
+        return result
+
+    async def list_ckan_packages(
+        self, search: str | None = None, limit: int = 40
+    ) -> List[Dict[str, Any]]:
+        params: Dict[str, Any] = {"rows": limit}
+        if search:
+            params["q"] = search
+        result = await self.ckan_request("package_search", params=params)
+        return result.get("results", [])
+
+    async def list_ckan_packages_all(
+        self, search: str | None = None, page_size: int = 1000
+    ) -> List[Dict[str, Any]]:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        params: Dict[str, Any] = {"rows": page_size, "start": 0}
+        if search:
+            params["q"] = search
+        first = await self.ckan_request("package_search", params=params, cache=False)
+        packages = list(first.get("results", []))
+        pages = await self._gather_bounded(
+            self.ckan_request("package_search", params={**params, "start": offset}, cache=False)
+            for offset in self._remaining_offsets(first)
+        )
+        for page in pages:
+            packages.extend(page.get("results", []))
+        return packages
+
+    async def get_ckan_package(self, name_or_id: str, *, refresh: bool = False) -> Dict[str, Any]:
+        return await self.ckan_request("package_show", params={"id": name_or_id}, refresh=refresh)
+
+    # ---- Resource handling ----
+    async def download_resource(self, resource: Dict[str, Any]) -> pathlib.Path:
+        return await self._download(*self._resource_target(resource))
+
+    async def _download(self, url: str, path: pathlib.Path) -> pathlib.Path:
+        headers = self._conditional_headers(url, path)
+        resp = await self._get(url, stream=True, headers=headers, timeout=300)
+        try:
+            if resp.status_code == 304:
+                self._record_download(url, path, headers["If-None-Match"])
+                return path
+            resp.raise_for_status()
+            # We asked for identity; only run the decoder if the server encoded anyway.
+            encoded = resp.headers.get("Content-Encoding", "identity").lower() != "identity"
+            chunks = resp.aiter_bytes if encoded else resp.aiter_raw
+            with self._staged_file(path) as handle:
+                async for chunk in chunks(self.DOWNLOAD_CHUNK_SIZE):
+                    # Staging dirs are often on shared filesystems; keep slow writes off the loop.
+                    await asyncio.to_thread(handle.write, chunk)
+            self._record_download(url, path, resp.headers.get("ETag"))
+        finally:
+            await resp.aclose()
+        return path
+
+    async def stage_resources(self, package: Dict[str, Any]) -> List[pathlib.Path]:
+        resources = package.get("resources", [])
+        if not resources:
+            return []
+        staged, pending = self._plan_staging(resources)
+        if pending:
+            results = await self._gather_bounded(
+                (self._download(url, path) for url, (_, path) in pending.items()),
+                return_exceptions=True,
+            )
+            for (url, (res, _)), result in zip(pending.items(), results):
+                if isinstance(result, BaseException):  # pragma: no cover - depends on remote endpoints
+                    logging.warning("Could not stage %s: %s", res.get("name"), result)
+                else:
+                    staged[url] = result
+            self._save_stage_cache()
+        return self._ordered_staged(resources, staged)
+
+    # ---- ESS-DIVE submission ----
+    async def submit_to_essdive(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.dry_run:
+            return {"status": "skipped", "reason": "dry_run_enabled"}
+        headers, body = self._essdive_body(payload)
+        url = f"{self.ess_url}/datasets"
+        resp = await self._client.post(url, headers=headers, content=body, timeout=90)
+        resp.raise_for_status()
+        return _json_loads(resp.content)
+
+
 def fetch_ckan_token_via_tapis(
     username: str,
     password: str,